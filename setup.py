@@ -23,6 +23,10 @@ setup(
     url='https://github.com/glensc/python-pytrakt',
     packages=packages,
     install_requires=requires,
+    extras_require={
+        'httpx': ['httpx[http2]'],
+        'orjson': ['orjson'],
+    },
     license='Apache 2.0',
     zip_safe=False,
     classifiers=[
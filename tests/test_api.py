@@ -1,3 +1,5 @@
+import pytest
+
 from trakt.api import HttpClient
 from trakt.core import api
 from trakt.tv import TVShow
@@ -15,3 +17,112 @@ def test_tvshow_properties():
     show = TVShow("Game of Thrones")
     assert show.title == "Game of Thrones"
     assert show.certification == "TV-MA"
+
+
+def test_session_singleton():
+    """Test that the lazily created session is shared with the HttpClient."""
+    from trakt import core
+
+    assert core.session is core.get_session()
+    assert api().session is core.get_session()
+
+
+def test_session_defaults():
+    """Test that the global session retries and carries the default headers."""
+    from trakt.core import get_session
+
+    session = get_session()
+    adapter = session.get_adapter('https://api.trakt.tv/')
+    assert adapter.max_retries.total == 3
+    assert 502 in adapter.max_retries.status_forcelist
+    assert session.headers['trakt-api-version'] == '2'
+
+
+def test_caller_session_unchanged():
+    """Test that HttpClient does not add its headers to a caller supplied session."""
+    from requests import Session
+
+    session = Session()
+    HttpClient('https://api.trakt.tv/', session)
+
+    assert 'trakt-api-version' not in session.headers
+
+
+def test_request_headers():
+    """Test that the default headers are read from the client on every request."""
+    from trakt.transport import requests_session
+
+    client = HttpClient('https://api.trakt.tv/', requests_session(HttpClient.headers))
+    assert client.request_headers() is None
+
+    client.headers = {'Content-Type': 'application/json', 'trakt-api-version': '3'}
+    assert client.request_headers() == {'Content-Type': 'application/json', 'trakt-api-version': '3'}
+
+
+def test_httpx_session():
+    """Test that HttpClient can make requests through the httpx backend."""
+    httpx = pytest.importorskip('httpx')
+    from trakt.transport import HttpxSession
+
+    def handler(request):
+        assert request.headers['trakt-api-version'] == '2'
+        return httpx.Response(200, json={'path': request.url.path})
+
+    session = HttpxSession(httpx.Client(transport=httpx.MockTransport(handler)))
+    client = HttpClient('https://api.trakt.tv/', session)
+
+    assert client.get('shows/trending') == {'path': '/shows/trending'}
+
+
+def test_httpx_session_retry(monkeypatch):
+    """Test that the httpx backend retries idempotent requests on gateway errors."""
+    httpx = pytest.importorskip('httpx')
+    from trakt import transport
+
+    monkeypatch.setattr(transport.time, 'sleep', lambda seconds: None)
+    statuses = [503, 502, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={})
+
+    session = transport.HttpxSession(httpx.Client(transport=httpx.MockTransport(handler)))
+    assert session.request('get', 'https://api.trakt.tv/shows').status_code == 200
+    assert statuses == []
+
+    statuses = [503, 200]
+    assert session.request('post', 'https://api.trakt.tv/sync', data='{}').status_code == 503
+
+
+def test_urllib3_session():
+    """Test that HttpClient can make requests through the urllib3 backend."""
+    from types import SimpleNamespace
+
+    from trakt.transport import Urllib3Session
+
+    class Pool:
+        def request(self, method, url, body=None, headers=None, timeout=None):
+            assert headers['trakt-api-version'] == '2'
+            assert headers['Authorization'] == 'Bearer TOKEN'
+            return SimpleNamespace(status=200, headers={}, data=f'{{"url": "{url}"}}'.encode())
+
+    def auth(request):
+        request.headers['Authorization'] = 'Bearer TOKEN'
+        return request
+
+    client = HttpClient('https://api.trakt.tv/', Urllib3Session(Pool()))
+    client.auth = auth
+
+    assert client.get('shows/trending') == {'url': 'https://api.trakt.tv/shows/trending'}
+
+
+def test_error_map_read_only():
+    """Test that the shared status code map cannot be modified through a client."""
+    with pytest.raises(TypeError):
+        api().error_map[404] = None
+
+
+def test_config_path():
+    """Test that CONFIG_PATH is available from both trakt and trakt.core."""
+    import trakt
+
+    assert trakt.CONFIG_PATH == trakt.core.CONFIG_PATH
@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 """unit tests to define behavior of custom exception types"""
-from trakt.errors import (BadRequestException, ConflictException,
-                          ForbiddenException, NotFoundException,
-                          OAuthException, ProcessException, RateLimitException,
-                          TraktException, TraktInternalException,
-                          TraktUnavailable)
+import pickle
+
+from requests import Response
+
+from trakt.errors import (BadRequestException, BadResponseException,
+                          ConflictException, ForbiddenException,
+                          NotFoundException, OAuthException,
+                          OAuthRefreshException, ProcessException,
+                          RateLimitException, TraktException,
+                          TraktInternalException, TraktUnavailable,
+                          exception_for_status)
+
+
+def make_response(status_code, content=b'', headers=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
 
 
 def test_trakt_exception():
@@ -13,6 +27,26 @@ def test_trakt_exception():
     assert texc.message is None
 
 
+def test_exception_str():
+    class CustomException(TraktException):
+        message = 'base msg'
+
+        def __str__(self):
+            return 'custom msg'
+
+    assert str(CustomException()) == 'custom msg'
+
+    texc = BadRequestException()
+    texc.message = 'instance msg'
+    assert str(texc) == 'instance msg'
+
+
+def test_exception_pickle():
+    texc = pickle.loads(pickle.dumps(BadResponseException(response='r', details='d')))
+    assert texc.response == 'r'
+    assert texc.details == 'd'
+
+
 def test_400_exception():
     texc = BadRequestException()
     assert texc.http_code == 400
@@ -62,6 +96,28 @@ def test_429_exception():
     assert str(texc) == texc.message
 
 
+def test_429_exception_details():
+    response = make_response(429, headers={'x-ratelimit': '{"name": "UNAUTHED_API_GET_LIMIT", "remaining": 0}'})
+    texc = RateLimitException(response)
+    assert texc.details == {"name": "UNAUTHED_API_GET_LIMIT", "remaining": 0}
+
+    texc = RateLimitException(make_response(429, headers={'x-ratelimit': 'garbage'}))
+    assert texc.details is None
+
+
+def test_oauth_refresh_exception():
+    content = b'{"error": "invalid_grant", "error_description": "The provided authorization grant is invalid"}'
+    texc = OAuthRefreshException(make_response(401, content))
+    assert texc.error == "invalid_grant"
+    assert texc.error_description == "The provided authorization grant is invalid"
+
+    texc = OAuthRefreshException(make_response(401), data={"error": "invalid_grant"})
+    assert texc.error == "invalid_grant"
+
+    texc = pickle.loads(pickle.dumps(OAuthRefreshException(None, data={"error": "invalid_grant"})))
+    assert texc.error == "invalid_grant"
+
+
 def test_500_exception():
     texc = TraktInternalException()
     assert texc.http_code == 500
@@ -74,3 +130,12 @@ def test_503_exception():
     assert texc.http_code == 503
     assert texc.message == 'Trakt Unavailable - server overloaded'
     assert str(texc) == texc.message
+
+
+def test_exception_for_status():
+    response = make_response(404)
+    texc = exception_for_status(404, response)
+    assert type(texc) is NotFoundException
+    assert texc.response is response
+    assert type(exception_for_status(401)) is OAuthException
+    assert type(exception_for_status(418)) is TraktException
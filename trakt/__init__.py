@@ -9,3 +9,13 @@ except ImportError:
 from .__version__ import __version__
 
 __author__ = 'Jon Nappi, Elan Ruusamäe'
+
+
+def __getattr__(name):
+    # CONFIG_PATH is resolved on first use by trakt.core, see trakt.core.__getattr__
+    if name == 'CONFIG_PATH':
+        from trakt import core
+
+        return core.CONFIG_PATH
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
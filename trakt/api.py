@@ -1,8 +1,9 @@
 import json
 import logging
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache
 from json import JSONDecodeError
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 from requests import Session
 from requests.auth import AuthBase
@@ -11,6 +12,7 @@ from trakt import errors
 from trakt.config import AuthConfig
 from trakt.core import TIMEOUT
 from trakt.errors import BadResponseException, OAuthException
+from trakt.utils import loads
 
 __author__ = 'Elan Ruusamäe'
 
@@ -21,8 +23,8 @@ class HttpClient:
 
     logger = logging.getLogger(__name__)
 
-    #: Default request HEADERS
-    headers = {'Content-Type': 'application/json', 'trakt-api-version': '2'}
+    #: Default request HEADERS, read-only as they are shared by all instances
+    headers = MappingProxyType({'Content-Type': 'application/json', 'trakt-api-version': '2'})
 
     def __init__(self, base_url: str, session: Session, timeout=None):
         """
@@ -31,6 +33,8 @@ class HttpClient:
         Parameters:
             base_url (str): The base URL for API requests.
             session (Session): A requests Session object for managing HTTP connections.
+                The default request headers are sent with every request, unless the session
+                already carries them.
             timeout (float, optional): Request timeout in seconds. Defaults to a predefined TIMEOUT value if not specified.
         """
         self._auth = None
@@ -123,11 +127,12 @@ class HttpClient:
         """
 
         url = self.base_url + url
+        headers = self.request_headers()
         self.logger.debug('REQUEST [%s] (%s)', method, url)
         if method == 'get':  # GETs need to pass data as params, not body
-            response = self.session.request(method, url, headers=self.headers, auth=self.auth, timeout=self.timeout, params=data)
+            response = self.session.request(method, url, headers=headers, auth=self.auth, timeout=self.timeout, params=data)
         else:
-            response = self.session.request(method, url, headers=self.headers, auth=self.auth, timeout=self.timeout, data=json.dumps(data))
+            response = self.session.request(method, url, headers=headers, auth=self.auth, timeout=self.timeout, data=json.dumps(data))
         self.logger.debug('RESPONSE [%s] (%s): %s', method, url, str(response))
         if response.status_code == 204:  # HTTP no content
             return None
@@ -135,28 +140,37 @@ class HttpClient:
 
         return self.decode_response(response)
 
+    def request_headers(self):
+        """
+        Get the default headers to send with a request.
+
+        Returns:
+            dict | None: The default headers, or None if the session already carries them.
+                Sessions from trakt.transport do, other sessions are left unchanged.
+        """
+        session_headers = getattr(self.session, 'headers', {})
+        if all(session_headers.get(name) == value for name, value in self.headers.items()):
+            return None
+
+        return dict(self.headers)
+
     @staticmethod
     def decode_response(response):
         try:
-            return json.loads(response.content.decode('UTF-8', 'ignore'))
-        except JSONDecodeError as e:
+            return loads(response.content)
+        except (JSONDecodeError, UnicodeDecodeError) as e:
             raise BadResponseException(f"Unable to parse JSON: {e}")
 
     def raise_if_needed(self, response):
-        if response.status_code in self.error_map:
-            raise self.error_map[response.status_code](response)
+        error = self.error_map.get(response.status_code)
+        if error:
+            raise error(response)
 
     @property
-    @lru_cache(maxsize=None)
     def error_map(self):
         """Map HTTP response codes to exception types
         """
-
-        # Get all of our exceptions except the base exception
-        errs = [getattr(errors, att) for att in errors.__all__
-                if att != 'TraktException']
-
-        return {err.http_code: err for err in errs}
+        return errors._HTTP_CODE_MAP
 
 
 class TokenAuth(AuthBase):
@@ -180,7 +194,7 @@ class TokenAuth(AuthBase):
 
     def __call__(self, r):
         # Skip oauth requests
-        if r.path_url.startswith('/oauth/'):
+        if urlsplit(str(r.url)).path.startswith('/oauth/'):
             return r
 
         [client_id, client_token] = self.get_token()
@@ -10,6 +10,16 @@ from typing import Optional
 
 @dataclass
 class AuthConfig:
+    __slots__ = (
+        'config_path',
+        'APPLICATION_ID',
+        'CLIENT_ID',
+        'CLIENT_SECRET',
+        'OAUTH_EXPIRES_AT',
+        'OAUTH_REFRESH',
+        'OAUTH_TOKEN',
+    )
+
     APPLICATION_ID: Optional[str]
     CLIENT_ID: Optional[str]
     CLIENT_SECRET: Optional[str]
@@ -4,17 +4,15 @@ trakt package
 """
 
 import os
-from functools import lru_cache
+import sys
 from typing import NamedTuple
 
-import requests
-
 __author__ = 'Jon Nappi'
 __all__ = ['Airs', 'Alias', 'Comment', 'Genre', 'get', 'delete', 'post', 'put',
            'init', 'BASE_URL', 'CLIENT_ID', 'CLIENT_SECRET', 'DEVICE_AUTH',
-           'CONFIG_PATH', 'OAUTH_TOKEN',
+           'OAUTH_TOKEN',
            'OAUTH_REFRESH', 'PIN_AUTH', 'OAUTH_AUTH', 'AUTH_METHOD',
-           'config', 'api',
+           'config', 'api', 'get_session',
            'TIMEOUT',
            'APPLICATION_ID']
 
@@ -28,9 +26,6 @@ CLIENT_ID = None
 #: The Trakt.tv OAuth Client Secret for your OAuth Application
 CLIENT_SECRET = None
 
-#: Default path for where to store your trakt.tv API authentication information
-CONFIG_PATH = os.path.join(os.path.expanduser('~'), '.pytrakt.json')
-
 #: Your personal Trakt.tv OAUTH Bearer Token
 OAUTH_TOKEN = None
 
@@ -58,8 +53,12 @@ APPLICATION_ID = None
 #: Timeout in seconds for all requests
 TIMEOUT = 30
 
-#: Global session to make requests with
-session = requests.Session()
+# Global session to make requests with, created on first use by get_session()
+_session = None
+
+# Singletons created on first use by config() and api()
+_config = None
+_api = None
 
 
 def init(*args, **kwargs):
@@ -69,21 +68,77 @@ def init(*args, **kwargs):
     return init_auth(AUTH_METHOD, *args, **kwargs)
 
 
-@lru_cache(maxsize=None)
+def get_session():
+    """Return the global session to make requests with.
+
+    The session is created on first use, so that importing trakt does not
+    load requests until a request is made. Assign ``trakt.core.session``
+    before the first request to override it.
+
+    Set the ``TRAKT_HTTP_BACKEND`` environment variable to ``httpx`` to use
+    an HTTP/2 capable httpx client, or to ``urllib3`` to use a bare urllib3
+    connection pool instead of requests.
+    """
+    global _session
+    if _session is None:
+        _session = globals().get('session') or _create_session()
+
+    return _session
+
+
+def _create_session():
+    from trakt import transport
+    from trakt.api import HttpClient
+
+    backend = os.environ.get('TRAKT_HTTP_BACKEND')
+    if backend == 'httpx':
+        return transport.httpx_session(HttpClient.headers)
+    if backend == 'urllib3':
+        return transport.urllib3_session(HttpClient.headers)
+
+    return transport.requests_session(HttpClient.headers)
+
+
+def __getattr__(name):
+    if name == 'session':
+        return get_session()
+
+    if name == 'CONFIG_PATH':
+        # Default path for where to store your trakt.tv API authentication
+        # information, resolved on first use rather than at import
+        path = os.path.join(os.path.expanduser('~'), '.pytrakt.json')
+        globals()['CONFIG_PATH'] = path
+
+        return path
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if sys.version_info < (3, 7):
+    # No module __getattr__ (PEP 562), so resolve the lazy names eagerly
+    session = _create_session()
+    CONFIG_PATH = __getattr__('CONFIG_PATH')
+    __all__.append('CONFIG_PATH')
+
+
 def config():
-    from trakt.config import AuthConfig
+    global _config
+    if _config is None:
+        from trakt.config import AuthConfig
+
+        config_path = globals().get('CONFIG_PATH') or __getattr__('CONFIG_PATH')
+        _config = AuthConfig(config_path).update(
+            APPLICATION_ID=APPLICATION_ID,
+            CLIENT_ID=CLIENT_ID,
+            CLIENT_SECRET=CLIENT_SECRET,
+            OAUTH_EXPIRES_AT=OAUTH_EXPIRES_AT,
+            OAUTH_REFRESH=OAUTH_REFRESH,
+            OAUTH_TOKEN=OAUTH_TOKEN,
+        )
 
-    return AuthConfig(CONFIG_PATH).update(
-        APPLICATION_ID=APPLICATION_ID,
-        CLIENT_ID=CLIENT_ID,
-        CLIENT_SECRET=CLIENT_SECRET,
-        OAUTH_EXPIRES_AT=OAUTH_EXPIRES_AT,
-        OAUTH_REFRESH=OAUTH_REFRESH,
-        OAUTH_TOKEN=OAUTH_TOKEN,
-    )
+    return _config
 
 
-@lru_cache(maxsize=None)
 def api():
     """
     Create an HTTP client for interacting with the Trakt API using configured authentication.
@@ -92,16 +147,18 @@ def api():
         HttpClient: A configured HTTP client with token-based authentication for making API requests.
 
     Notes:
-        - Uses the global BASE_URL and session for creating the HTTP client
+        - Uses the global BASE_URL and get_session() for creating the HTTP client
         - Configures the client with a TokenAuth instance using the current authentication configuration
-        - Cached function that returns a same client instance on each call
+        - Returns the same client instance on each call
     """
-    from trakt.api import HttpClient, TokenAuth
+    global _api
+    if _api is None:
+        from trakt.api import HttpClient, TokenAuth
 
-    client = HttpClient(BASE_URL, session)
-    client.auth = TokenAuth(client=client, config=config())
+        _api = HttpClient(BASE_URL, get_session())
+        _api.auth = TokenAuth(client=_api, config=config())
 
-    return client
+    return _api
 
 
 class Airs(NamedTuple):
@@ -4,6 +4,15 @@ codes are ignored because the only requests that this library sends out are
 guaranteed to have the application/json MIME type set.
 """
 
+from types import MappingProxyType
+
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8
+    cached_property = property
+
+from trakt.utils import loads
+
 __author__ = 'Jon Nappi'
 __all__ = [
     # Base Exception
@@ -28,6 +37,9 @@ __all__ = [
     'TraktInternalException',
     'TraktBadGateway',
     'TraktUnavailable',
+
+    # Helpers
+    'exception_for_status',
 ]
 
 
@@ -69,15 +81,23 @@ class OAuthException(TraktException):
 
 
 class OAuthRefreshException(OAuthException):
-    def __init__(self, response=None):
+    def __init__(self, response=None, data=None):
         super().__init__(response)
-        self.data = self.response.json()
+        # Body already decoded by the caller, if any
+        self._data = data
 
-    @property
+    @cached_property
+    def data(self):
+        if self._data is not None:
+            return self._data
+
+        return loads(self.response.content)
+
+    @cached_property
     def error(self):
         return self.data["error"]
 
-    @property
+    @cached_property
     def error_description(self):
         return self.data["error_description"]
 
@@ -134,13 +154,11 @@ class RateLimitException(TraktException):
     def retry_after(self):
         return int(self.response.headers.get("retry-after", 1))
 
-    @property
+    @cached_property
     def details(self):
-        from json import JSONDecodeError, loads
-
         try:
             return loads(self.response.headers.get("x-ratelimit", ""))
-        except JSONDecodeError:
+        except ValueError:
             return None
 
 
@@ -182,3 +200,25 @@ class TraktUnavailable(TraktException):
 
     http_code = 503
     message = 'Trakt Unavailable - server overloaded'
+
+
+# Exception type by HTTP status code, read-only as it is shared by all clients
+_HTTP_CODE_MAP = MappingProxyType({cls.http_code: cls for cls in (
+    BadRequestException, OAuthException, ForbiddenException, NotFoundException,
+    MethodNotAllowedException, ConflictException, ProcessException,
+    LockedUserAccountException, AccountLimitExceeded, RateLimitException,
+    TraktInternalException, TraktBadGateway, TraktUnavailable,
+)})
+
+
+def exception_for_status(code, response=None):
+    """Create the exception for HTTP status *code*
+
+    :param code: HTTP status code of the response
+    :param response: The response to attach to the exception
+    :return: An instance of the matching :class:`TraktException` subclass,
+        or :class:`TraktException` itself for an unknown status code
+    """
+    cls = _HTTP_CODE_MAP.get(code, TraktException)
+
+    return cls(response)
@@ -0,0 +1,159 @@
+"""Factories for the HTTP sessions used by :class:`trakt.api.HttpClient`"""
+
+import time
+from types import SimpleNamespace
+from urllib.parse import urlencode
+
+from trakt.utils import loads
+
+__author__ = 'Elan Ruusamäe'
+
+#: Number of connections to keep alive per host
+POOL_SIZE = 32
+
+#: How many times to retry idempotent requests on transient gateway errors
+RETRIES = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = frozenset([502, 503, 504])
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+def _retry():
+    """Retry idempotent requests on transient gateway errors"""
+    from urllib3.util.retry import Retry
+
+    return Retry(
+        total=RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+
+
+def requests_session(headers):
+    """Create a :class:`requests.Session` with pooled connections and retries
+    of idempotent requests on transient gateway errors.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=_retry())
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+
+    return session
+
+
+def httpx_session(headers):
+    """Create an HTTP/2 capable session backed by :class:`httpx.Client`,
+    with the same retries as the other backends.
+
+    Requires the ``httpx[http2]`` extra to be installed.
+    """
+    import httpx
+
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=POOL_SIZE, max_connections=2 * POOL_SIZE),
+        retries=RETRIES,
+    )
+    client = httpx.Client(transport=transport, headers=dict(headers))
+
+    return HttpxSession(client)
+
+
+class HttpxSession:
+    """Adapt :class:`httpx.Client` to the subset of the :class:`requests.Session`
+    interface used by :class:`trakt.api.HttpClient`
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def request(self, method, url, headers=None, auth=None, timeout=None, params=None, data=None):
+        # httpx only retries failed connections, retry gateway errors like urllib3 does
+        retries = RETRIES if method.upper() in RETRY_METHODS else 0
+        for attempt in range(retries + 1):
+            response = self.client.request(
+                method, url, headers=headers, auth=auth, timeout=timeout, params=params, content=data,
+            )
+            if attempt == retries or response.status_code not in RETRY_STATUSES:
+                return response
+
+            response.close()
+            time.sleep(self.retry_delay(response, attempt))
+
+    @staticmethod
+    def retry_delay(response, attempt):
+        """Seconds to wait before retrying: Retry-After if given, exponential backoff otherwise"""
+        retry_after = response.headers.get('retry-after', '')
+        if retry_after.isdigit():
+            return int(retry_after)
+
+        return RETRY_BACKOFF * 2 ** attempt
+
+    def close(self):
+        self.client.close()
+
+
+def urllib3_session(headers):
+    """Create a session backed by a bare :class:`urllib3.PoolManager`,
+    skipping the per request overhead of requests.
+    """
+    import urllib3
+
+    session = Urllib3Session(urllib3.PoolManager(maxsize=POOL_SIZE, retries=_retry()))
+    session.headers.update(headers)
+
+    return session
+
+
+class Urllib3Session:
+    """Adapt :class:`urllib3.PoolManager` to the subset of the
+    :class:`requests.Session` interface used by :class:`trakt.api.HttpClient`
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.headers = {}
+
+    def request(self, method, url, headers=None, auth=None, timeout=None, params=None, data=None):
+        if params:
+            query = {key: value for key, value in params.items() if value is not None}
+            url = f"{url}?{urlencode(query, doseq=True)}"
+
+        request = SimpleNamespace(url=url, headers={**self.headers, **(headers or {})})
+        if auth is not None:
+            request = auth(request)
+
+        response = self.pool.request(
+            method.upper(), request.url, body=data, headers=request.headers, timeout=timeout,
+        )
+
+        return Urllib3Response(response)
+
+    def close(self):
+        self.pool.clear()
+
+
+class Urllib3Response:
+    """The subset of :class:`requests.Response` used by trakt"""
+
+    def __init__(self, response):
+        self.status_code = response.status
+        self.headers = response.headers
+        self.content = response.data
+
+    def __repr__(self):
+        return f"<Response [{self.status_code}]>"
+
+    def json(self):
+        return loads(self.content)
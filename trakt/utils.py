@@ -3,8 +3,14 @@ import re
 import unicodedata
 from datetime import datetime, timezone
 
+try:
+    # Decode JSON with orjson when available
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 __author__ = 'Jon Nappi'
-__all__ = ['slugify', 'airs_date', 'now', 'timestamp', 'extract_ids']
+__all__ = ['slugify', 'airs_date', 'now', 'timestamp', 'extract_ids', 'loads']
 
 
 def slugify(value):